@@ -56,10 +56,10 @@ def home_directory(tmp_path, mocker):
 def cleanup():
     """Fixture to reset various vimiv properties at the end of each test."""
     yield
+    api.settings.reset()  # May start throttled functions, e.g. to reload the directory
     utils.Throttle.stop_all()
     utils.Pool.clear()
     utils.Pool.wait(5000)
-    api.settings.reset()
     api.mark.mark_clear()
     runners._last_command.clear()
     filelist._paths = []
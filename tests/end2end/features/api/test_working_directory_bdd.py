@@ -18,3 +18,13 @@ def check_monitored_directories(n_directories):
 @bdd.then(bdd.parsers.parse("there should be {n_files:d} monitored files"))
 def check_monitored_files(n_files):
     assert len(api.working_directory.handler.files()) == n_files
+
+
+@bdd.then(
+    bdd.parsers.parse("there should be {n_images:d} image in the working directory")
+)
+@bdd.then(
+    bdd.parsers.parse("there should be {n_images:d} images in the working directory")
+)
+def check_images_in_working_directory(n_images):
+    assert len(api.working_directory.handler.images) == n_images
@@ -17,3 +17,12 @@ Feature: React to working directory changes
         Given I open any image
         When I run set monitor_filesystem false
         Then there should be 0 monitored files
+
+    Scenario: Reload the directory when trusting image extensions changes
+        Given I open any directory
+        When I create the file 'not_an_image.jpg'
+        And I wait for the working directory handler
+        Then there should be 1 image in the working directory
+        When I run set trust_extensions false
+        And I wait for the working directory handler
+        Then there should be 0 images in the working directory
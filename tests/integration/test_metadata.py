@@ -2,8 +2,13 @@
 
 """Tests for vimiv.imutils.metadata."""
 
+import struct
+
 import pytest
 
+from vimiv.qt.core import QBuffer
+from vimiv.qt.gui import QPixmap
+
 from vimiv.imutils import metadata
 from vimiv.plugins import metadata_piexif, metadata_pyexiv2
 
@@ -59,3 +64,114 @@ def test_piexif_initializes(piexif):
 def test_pyexiv2_initializes(pyexiv2):
     assert metadata_pyexiv2.MetadataPyexiv2 in metadata._registry
     assert metadata.has_metadata_support()
+
+
+@pytest.fixture
+def counting_plugin():
+    """Fixture to register a plugin which counts the number of metadata reads."""
+
+    class CountingPlugin(metadata.MetadataPlugin):
+        reads = 0
+
+        def __init__(self, _path):
+            pass
+
+        @staticmethod
+        def name():
+            return "counting"
+
+        @staticmethod
+        def version():
+            return ""
+
+        def get_metadata(self, _keys):
+            CountingPlugin.reads += 1
+            return {"Key": ("Key", str(CountingPlugin.reads))}
+
+        def get_keys(self):
+            return iter(())
+
+    metadata._registry = []
+    metadata.register(CountingPlugin)
+    return CountingPlugin
+
+
+def test_metadata_cached_per_file_version(counting_plugin, tmp_path):
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"content")
+
+    first = metadata.MetadataHandler(str(path)).get_metadata(["Key"])
+    assert metadata.MetadataHandler(str(path)).get_metadata(["Key"]) == first
+    assert counting_plugin.reads == 1
+
+    path.write_bytes(b"changed content")
+    assert metadata.MetadataHandler(str(path)).get_metadata(["Key"]) != first
+    assert counting_plugin.reads == 2
+
+
+def test_read_many(counting_plugin, tmp_path):
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"image{i:d}.jpg"
+        path.touch()
+        paths.append(str(path))
+    result = metadata.read_many(reversed(paths), ["Key"], workers=4)
+    assert sorted(result) == paths
+    assert counting_plugin.reads == len(paths)
+
+
+def test_handler_has_no_instance_dict():
+    assert not hasattr(metadata.MetadataHandler("path"), "__dict__")
+
+
+@pytest.fixture
+def jpeg(qapp, tmp_path):
+    path = str(tmp_path / "image.jpg")
+    QPixmap(32, 32).save(path, "jpg")
+    return path
+
+
+def test_piexif_get_metadata_ignores_unknown_key(piexif, jpeg, add_exif_information):
+    add_exif_information(
+        jpeg, {"0th": {metadata_piexif.piexif.ImageIFD.Make: b"vimiv"}}
+    )
+    data = metadata_piexif.MetadataPiexif(jpeg).get_metadata(
+        ["Exif.Image.Make", "Exif.Image.NotATag"]
+    )
+    assert data == {"Exif.Image.Make": ("Make", "vimiv")}
+
+
+def test_piexif_get_metadata_with_unknown_tag(piexif, jpeg):
+    image_ifd = metadata_piexif.piexif.ImageIFD
+    exif = metadata_piexif.piexif.load(jpeg)
+    exif["0th"][image_ifd.Make] = b"vimiv"
+    exif["0th"][image_ifd.Model] = b"unknown"
+    exif_bytes = metadata_piexif.piexif.dump(exif)
+    # Replace the id of the model tag with one unknown to piexif
+    model_entry = struct.pack(
+        ">HH", image_ifd.Model, metadata_piexif.piexif.TYPES.Ascii
+    )
+    assert exif_bytes.count(model_entry) == 1
+    unknown_entry = struct.pack(">HH", 0xC7FF, metadata_piexif.piexif.TYPES.Ascii)
+    exif_bytes = exif_bytes.replace(model_entry, unknown_entry)
+    metadata_piexif.piexif.insert(exif_bytes, jpeg)
+
+    data = metadata_piexif.MetadataPiexif(jpeg).get_metadata(
+        ["Exif.Image.Make", "Exif.Image.Model"]
+    )
+    assert data == {"Exif.Image.Make": ("Make", "vimiv")}
+
+
+def test_piexif_get_metadata_prefers_later_ifd(piexif, jpeg):
+    thumbnail = QBuffer()
+    QPixmap(8, 8).save(thumbnail, "jpg")
+    exif = metadata_piexif.piexif.load(jpeg)
+    xresolution = metadata_piexif.piexif.ImageIFD.XResolution
+    exif["0th"][xresolution] = (72, 1)
+    exif["1st"][xresolution] = (300, 1)
+    # piexif only writes the 1st IFD if the image contains a thumbnail
+    exif["thumbnail"] = bytes(thumbnail.data())
+    metadata_piexif.piexif.insert(metadata_piexif.piexif.dump(exif), jpeg)
+
+    data = metadata_piexif.MetadataPiexif(jpeg).get_metadata(["Exif.Image.XResolution"])
+    assert data == {"Exif.Image.XResolution": ("XResolution", "300/1")}
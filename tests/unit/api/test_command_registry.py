@@ -0,0 +1,38 @@
+# vim: ft=python fileencoding=utf-8 sw=4 et sts=4
+
+"""Tests for vimiv.api.commands."""
+
+import pytest
+
+from vimiv.api import commands, modes
+
+
+@pytest.fixture()
+def global_command():
+    """Fixture to register a global command and remove it afterwards."""
+
+    def dummy_command():
+        """Dummy command for testing."""
+
+    commands.register(name="dummy-command")(dummy_command)
+    yield commands._registry[modes.GLOBAL]["dummy-command"]
+    del commands._registry[modes.GLOBAL]["dummy-command"]
+
+
+@pytest.mark.parametrize("mode", modes.GLOBALS)
+def test_get_global_command_in_global_mode(global_command, mode):
+    assert commands.get("dummy-command", mode) is global_command
+    assert commands.exists("dummy-command", mode)
+    assert ("dummy-command", global_command) in commands.items(mode)
+
+
+def test_get_does_not_copy_global_commands(global_command):
+    commands.get("dummy-command", modes.IMAGE)
+    assert "dummy-command" not in commands._registry[modes.IMAGE]
+
+
+@pytest.mark.parametrize("mode", (modes.COMMAND, modes.MANIPULATE))
+def test_fail_get_global_command_in_non_global_mode(global_command, mode):
+    with pytest.raises(commands.CommandNotFound):
+        commands.get("dummy-command", mode)
+    assert not commands.exists("dummy-command", mode)
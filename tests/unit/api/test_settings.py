@@ -24,6 +24,19 @@ def test_init_setting():
     assert b.value
 
 
+@pytest.mark.parametrize(
+    "setting",
+    (
+        settings.image.autowrite,
+        settings.image.overzoom,
+        settings.thumbnail.size,
+        settings.sort.image_order,
+    ),
+)
+def test_setting_attributes_stored_in_slots(setting):
+    assert not setting.__dict__
+
+
 def test_check_default_after_change_for_setting():
     b = settings.BoolSetting("bool", True)
     b.value = False
@@ -57,6 +70,18 @@ def test_add_int_setting():
     assert i.value == 5
 
 
+def test_add_str_to_int_setting():
+    i = settings.IntSetting("int", 2, max_value=4)
+    i += "+3"
+    assert i.value == 4
+
+
+def test_fail_add_invalid_str_to_int_setting():
+    i = settings.IntSetting("int", 2)
+    with pytest.raises(ValueError, match="Cannot convert 'any'"):
+        i += "any"
+
+
 def test_multiply_int_setting():
     i = settings.IntSetting("int", 5)
     i *= 2
@@ -185,6 +210,31 @@ def test_order_setting_sort(
     assert sorted_values == expected_values
 
 
+@pytest.mark.parametrize("ignore_case", [True, False])
+@pytest.mark.parametrize(
+    "ordering_name, values, expected_values",
+    [
+        (
+            "alphabetical",
+            ["/b/c.j", "/a/d.j", "/c/a.j"],
+            ["/c/a.j", "/b/c.j", "/a/d.j"],
+        ),
+        (
+            "natural",
+            ["/a/a11.j", "/c/a5.j", "/b/a3.j"],
+            ["/b/a3.j", "/c/a5.j", "/a/a11.j"],
+        ),
+    ],
+)
+def test_order_setting_sort_multiple_directories(
+    monkeypatch, ordering_name, values, expected_values, ignore_case
+):
+    """Ensure paths from different directories are ordered by their basename."""
+    monkeypatch.setattr(settings.sort.ignore_case, "value", ignore_case)
+    o = settings.OrderSetting("order", ordering_name)
+    assert o.sort(values) == expected_values
+
+
 @pytest.mark.parametrize("reverse", [True, False])
 @pytest.mark.parametrize("ignore_case", [True, False])
 def test_order_setting_sort_none(monkeypatch, reverse, ignore_case):
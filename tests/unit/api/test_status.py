@@ -39,3 +39,9 @@ def test_fail_add_status_module():
 def test_evaluate_unknown_module():
     name = "{unknown-module}"
     assert status.evaluate(f"Dummy: {name}") == "Dummy: "
+
+
+def test_evaluate_multiple_modules(dummy_module):
+    name, content = dummy_module
+    text = f"{name} and {{unknown-module}} and {name}"
+    assert status.evaluate(text) == f"{content} and  and {content}"
@@ -28,3 +28,19 @@ def test_text_non_whitespace_with_non_whitespace(text):
         assert stripped_text == text.strip()
 
     function(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("command", ("", "command", [])),
+        ("12command", ("12", "command", [])),
+        (" 2command arg1  arg2 ", ("2", "command", ["arg1", "arg2"])),
+        ("command 'quoted arg' other", ("", "command", ["quoted arg", "other"])),
+        ('command "quoted arg"', ("", "command", ["quoted arg"])),
+        ("command escaped\\ arg", ("", "command", ["escaped arg"])),
+        ("command a\u3000b\xa0c", ("", "command", ["a\u3000b\xa0c"])),
+    ],
+)
+def test_parse(text, expected):
+    assert runners._parse(text) == expected
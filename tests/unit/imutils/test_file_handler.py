@@ -0,0 +1,16 @@
+# vim: ft=python fileencoding=utf-8 sw=4 et sts=4
+
+"""Tests for vimiv.imutils._file_handler."""
+
+import pytest
+
+from vimiv.imutils import _file_handler
+
+
+def test_write_invalid_image_with_trusted_extension(mocker, tmp_path):
+    """Ensure an invalid file is not accepted due to its image extension."""
+    pixmap = mocker.Mock()  # Saving does not write anything to the file
+    path = tmp_path / "image.jpg"
+    with pytest.raises(_file_handler.WriteError, match="No valid image written"):
+        _file_handler._write(pixmap, str(path), str(tmp_path / "original.jpg"))
+    assert not path.exists()
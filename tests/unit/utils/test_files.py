@@ -8,7 +8,7 @@ import tarfile
 
 import pytest
 
-from vimiv.utils import files
+from vimiv.utils import files, imageheader
 
 
 @pytest.fixture()
@@ -47,47 +47,103 @@ def directory_tree(tmp_path):
     return collections.namedtuple("directorytree", ("root", "files"))(tmp_path, files)
 
 
-def test_listdir_wrapper(mocker):
-    mocker.patch("os.listdir", return_value=["a.txt", "b.txt"])
-    mocker.patch("os.path.abspath", return_value="")
-    assert files.listdir("directory") == ["a.txt", "b.txt"]
+@pytest.fixture()
+def listdir_directory(tmp_path):
+    """Fixture to create a directory with a hidden and an ordinary file."""
+    for name in (".dotfile.txt", "a.txt"):
+        tmp_path.joinpath(name).touch()
+    return tmp_path
 
 
-def test_listdir_wrapper_returns_abspath(mocker):
-    dirname, paths = "dir", ["a.txt", "b.txt"]
-    mocker.patch("os.listdir", return_value=paths)
-    mocker.patch("os.path.abspath", return_value=dirname)
-    expected = [os.path.join(dirname, path) for path in paths]
-    assert files.listdir("directory") == expected
+def test_listdir_wrapper_returns_abspath(listdir_directory):
+    expected = [str(listdir_directory / "a.txt")]
+    assert files.listdir(str(listdir_directory)) == expected
 
 
-def test_listdir_wrapper_remove_hidden(mocker):
-    mocker.patch("os.listdir", return_value=[".dotfile.txt", "a.txt"])
-    mocker.patch("os.path.abspath", return_value="")
-    assert files.listdir("directory") == ["a.txt"]
+def test_listdir_wrapper_expands_user(monkeypatch, listdir_directory):
+    monkeypatch.setenv("HOME", str(listdir_directory))
+    expected = [str(listdir_directory / "a.txt")]
+    assert files.listdir("~") == expected
 
 
-def test_listdir_wrapper_show_hidden(mocker):
-    mocker.patch("os.listdir", return_value=[".dotfile.txt", "a.txt"])
-    mocker.patch("os.path.abspath", return_value="")
-    assert files.listdir("directory", show_hidden=True) == [".dotfile.txt", "a.txt"]
+def test_listdir_wrapper_show_hidden(listdir_directory):
+    expected = [str(listdir_directory / name) for name in (".dotfile.txt", "a.txt")]
+    assert sorted(files.listdir(str(listdir_directory), show_hidden=True)) == expected
 
 
-def test_directories_supported(mocker):
-    mocker.patch("os.path.isdir", return_value=True)
-    mocker.patch("os.path.isfile", return_value=False)
-    images, directories = files.supported(["a", "b"])
+def test_directories_supported(tmp_path):
+    paths = [str(tmp_path / name) for name in ("a", "b")]
+    for path in paths:
+        os.mkdir(path)
+    images, directories = files.supported(paths)
     assert not images
-    assert directories == ["a", "b"]
+    assert directories == paths
 
 
-def test_images_supported(mocker):
-    mocker.patch("os.path.isdir", return_value=False)
-    mocker.patch("os.path.isfile", return_value=True)
+def test_images_supported(mocker, tmp_path):
     mocker.patch("vimiv.utils.imageheader.detect", return_value=True)
-    images, directories = files.supported(["a", "b"])
-    assert images == ["a", "b"]
+    paths = []
+    for name in ("a", "b"):
+        path = tmp_path / name
+        path.touch()
+        paths.append(str(path))
+    images, directories = files.supported(paths)
+    assert images == paths
+    assert not directories
+
+
+def test_missing_paths_not_supported(tmp_path):
+    images, directories = files.supported([str(tmp_path / "missing")])
+    assert not images
+    assert not directories
+
+
+def test_supported_many_paths_keeps_order(mocker, tmp_path):
+    mocker.patch("vimiv.utils.imageheader.detect", return_value="jpg")
+    paths = []
+    for i in range(50):
+        path = tmp_path / f"{i:02d}"
+        if i % 2:
+            path.mkdir()
+        else:
+            path.touch()
+        paths.append(str(path))
+    images, directories = files.supported(reversed(paths))
+    assert images == paths[-2::-2]
+    assert directories == paths[::-2]
+
+
+def test_supported_many_paths_with_unsupported_format(mocker, tmp_path):
+    """Ensure the check of an unsupported format is removed safely from any thread."""
+    mocker.patch("vimiv.utils.imageheader._registry", [])
+    imageheader.register("not_a_format", lambda header, _f: header == b"dummy")
+    paths = []
+    for i in range(200):
+        path = tmp_path / f"{i:03d}"
+        path.write_bytes(b"dummy")
+        paths.append(str(path))
+    images, directories = files.supported(paths)
+    assert not images
     assert not directories
+    assert not imageheader._registry
+
+
+def test_special_and_text_files_not_supported(tmp_path):
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+    textfile = tmp_path / "text"
+    textfile.write_text("text")
+    images, directories = files.supported([str(fifo), str(textfile)])
+    assert not images
+    assert not directories
+
+
+def test_special_files_not_opened(mocker, tmp_path):
+    detect = mocker.spy(imageheader, "detect")
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+    assert files.supported([str(fifo), os.devnull]) == ([], [])
+    detect.assert_not_called()
 
 
 def test_tar_gz_not_an_image(tmp_path):
@@ -117,33 +173,75 @@ def test_is_image_on_fifo_file(qtbot, tmp_path):
 
 
 @pytest.mark.parametrize(
-    "size, expected", [(510, "510B"), (2048, "2.0K"), (3 * 1024**8, "3.0Y")]
+    "size, expected",
+    [
+        (0, "0.0B"),
+        (510, "510B"),
+        (1023, "1023B"),
+        (1024, "1.0K"),
+        (2048, "2.0K"),
+        (150 * 1024**2, "150M"),
+        (3 * 1024**8, "3.0Y"),
+    ],
 )
 def test_sizeof_fmt(size, expected):
     assert files.sizeof_fmt(size) == expected
 
 
-def test_get_size_directory_with_directories(mocker):
-    paths = [str(i) for i in range(15)]
-    mocker.patch("os.listdir", return_value=paths)
-    mocker.patch("os.path.isdir", return_value=True)
-    mocker.patch("os.path.isfile", return_value=False)
-    assert files.get_size_directory("any") == "15"
+def test_get_size_directory(directory_tree):
+    assert files.get_size_directory(str(directory_tree.root)) == "4"
 
 
-def test_get_size_directory_with_images(mocker):
-    paths = [str(i) for i in range(10)]
-    mocker.patch("os.listdir", return_value=paths)
-    mocker.patch("os.path.isdir", return_value=False)
-    mocker.patch.object(files, "is_image", return_value=True)
-    assert files.get_size_directory("any") == "10"
+def test_get_size_directory_on_error(tmp_path):
+    assert files.get_size_directory(str(tmp_path / "missing")) == "N/A"
 
 
 def test_get_size_with_permission_error(mocker):
-    mocker.patch("os.path.isfile", side_effect=PermissionError)
+    mocker.patch("os.stat", side_effect=PermissionError)
     assert files.get_size("any") == "N/A"
 
 
+def test_get_size_file(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"x" * 2048)
+    assert files.get_size(str(path)) == "2.0K"
+
+
 def test_listfiles(directory_tree):
     expected = sorted(directory_tree.files)
     assert expected == sorted(files.listfiles(str(directory_tree.root)))
+
+
+def test_listfiles_with_trailing_separator(directory_tree):
+    expected = sorted(directory_tree.files)
+    assert expected == sorted(files.listfiles(str(directory_tree.root) + os.sep))
+
+
+def test_listfiles_abspath(directory_tree):
+    expected = sorted(str(directory_tree.root / path) for path in directory_tree.files)
+    assert expected == sorted(files.listfiles(str(directory_tree.root), abspath=True))
+
+
+def test_listfiles_with_repeated_directory_name(monkeypatch, tmp_path):
+    nested = tmp_path / "root" / "sub" / "root"
+    nested.mkdir(parents=True)
+    (nested / "file").touch()
+    monkeypatch.chdir(tmp_path)
+    assert files.listfiles("root") == [os.path.join("sub", "root", "file")]
+
+
+@pytest.mark.parametrize("trust_extensions", (True, False))
+def test_is_image_trusts_extension(tmp_path, trust_extensions):
+    path = tmp_path / "not_an_image.JPG"
+    path.write_text("text")
+    assert (
+        files.is_image(str(path), trust_extensions=trust_extensions) is trust_extensions
+    )
+
+
+@pytest.mark.parametrize("trust_extensions", (True, False))
+def test_supported_trusts_extension(tmp_path, trust_extensions):
+    path = tmp_path / "not_an_image.jpg"
+    path.write_text("text")
+    images, _ = files.supported([str(path)], trust_extensions=trust_extensions)
+    assert bool(images) is trust_extensions
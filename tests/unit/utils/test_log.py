@@ -62,6 +62,13 @@ def test_lazy_logger_logs(capsys, setup_logging, lazy_logger):
     assert message in captured.err
 
 
+@pytest.mark.parametrize(
+    "level, enabled", ((logging.DEBUG, False), (logging.WARNING, True))
+)
+def test_lazy_logger_is_enabled_for(lazy_logger, level, enabled):
+    assert lazy_logger.isEnabledFor(level) == enabled
+
+
 @pytest.mark.parametrize("creation_time", ("before", "after"))
 def test_setup_logging_debug_loggers(capsys, creation_time):
     """Ensure debug loggers are created with the debug level and log debug messages.
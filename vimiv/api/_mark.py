@@ -97,8 +97,9 @@ class Mark(QObject):
         """
         _logger.debug("Calling %s on %d paths", action.value, len(paths))
         function = self._actions[action]
+        trust_extensions = settings.trust_extensions.value
         for path in paths:
-            if files.is_image(path):
+            if files.is_image(path, trust_extensions=trust_extensions):
                 try:
                     function(path)
                 except ValueError:
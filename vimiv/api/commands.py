@@ -120,12 +120,12 @@ def get(name: str, mode: modes.Mode = modes.GLOBAL) -> "_Command":
     Returns:
         The Command object asserted with name and mode.
     """
-    commands = _registry[mode]
-    if mode in modes.GLOBALS:
-        commands.update(_registry[modes.GLOBAL])
     try:
-        return commands[name]
+        return _registry[mode][name]
     except KeyError:
+        if mode in modes.GLOBALS:
+            with contextlib.suppress(KeyError):
+                return _registry[modes.GLOBAL][name]
         raise CommandNotFound(f"{name}: unknown command for mode {mode.name}")
 
 
@@ -163,6 +163,8 @@ def items(mode: modes.Mode) -> typing.ItemsView[str, "_Command"]:
     Returns:
         typing.ItemsView allowing iteration over items.
     """
+    if mode in modes.GLOBALS:
+        return {**_registry[modes.GLOBAL], **_registry[mode]}.items()
     return _registry[mode].items()
 
 
@@ -175,7 +177,9 @@ def exists(name: str, mode: modes.Mode) -> bool:
     Returns:
         True if the command exists.
     """
-    return name in _registry[mode]
+    if name in _registry[mode]:
+        return True
+    return mode in modes.GLOBALS and name in _registry[modes.GLOBAL]
 
 
 class _CommandArguments(argparse.ArgumentParser):
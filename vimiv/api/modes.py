@@ -51,7 +51,7 @@ class Mode(QObject):
         widget: QWidget associated with this mode.
 
         _last: Mode that was active before entering this one.
-        _name: Name of the mode used for commands which require a string
+        _name: Lower-case name of the mode used for commands which require a string
             representation.
         _id: The unique identifier used to compare modes.
         _entered: True if the mode has ever been entered.
@@ -73,7 +73,7 @@ class Mode(QObject):
         super().__init__()
         self.last_fallback = self._last = cast(Mode, last)
         self.widget = cast(_ModeWidget, None)  # Initialized using @widget
-        self._name = name
+        self._name = name.lower()
         self._entered = False
 
         # Store global ID as ID and increase it by one
@@ -191,8 +191,9 @@ def get_by_name(name: str) -> Mode:
     Returns:
         The corresponding :class:`vimiv.api.modes.Mode` class.
     """
+    name = name.lower()
     for mode in ALL:
-        if mode.name.lower() == name.lower():
+        if mode.name == name:
             return mode
     raise InvalidMode(f"'{name.upper()}' is not a valid mode")
 
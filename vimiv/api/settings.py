@@ -6,9 +6,10 @@ Module attributes:
     _storage: Initialized Storage object to store settings globally.
 """
 
-import contextlib
 import enum
+import logging
 import os
+import sys
 from typing import Any, Dict, ItemsView, List, Callable, Iterable
 
 from vimiv.qt.core import QObject, Signal
@@ -40,13 +41,15 @@ def get_value(name: str) -> Any:
     Returns:
         The value of the setting in its python data type.
     """
-    return _storage[name].value
+    # Skip the value property as this is called for every statusbar and title update
+    return _storage[name]._value  # pylint: disable=protected-access
 
 
 def reset() -> None:
     """Reset all settings to their default value."""
     for setting in _storage.values():
-        setting.set_to_default()
+        if setting._value != setting._default:  # pylint: disable=protected-access
+            setting.set_to_default()
 
 
 def items() -> ItemsView[str, "Setting"]:
@@ -72,6 +75,8 @@ class Setting(QObject):
         changed: Emitted with the new value if the setting changed.
     """
 
+    __slots__ = "name", "desc", "hidden", "_default", "_suggestions", "_value"
+
     changed = Signal(object)
 
     def __init__(
@@ -87,12 +92,12 @@ class Setting(QObject):
         See the class attributes section for a description of the arguments.
         """
         super().__init__()
-        self.name = name
+        self.name = sys.intern(name)
         self.desc = desc
         self.hidden = hidden
         self._value = self._default = default_value
         self._suggestions = suggestions if suggestions is not None else []
-        _storage[name] = self  # Store setting in storage
+        _storage[self.name] = self  # Store setting in storage
 
     @property
     def typ(self) -> type:
@@ -112,7 +117,8 @@ class Setting(QObject):
         new_value = self.convert(value)
         if new_value != self._value:
             self._value = new_value
-            _logger.debug("Setting '%s' to '%s'", self.name, value)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("Setting '%s' to '%s'", self.name, value)
             self.changed.emit(self._value)
 
     def set_to_default(self) -> None:
@@ -127,11 +133,12 @@ class Setting(QObject):
 
     def convert(self, value: Any) -> Any:
         """Convert value to setting type before using it."""
-        with contextlib.suppress(ValueError):  # Re-raise later with consistent message
+        try:
             if isinstance(value, str):
                 return self.convertstr(value)
             return self.typ(value)
-        raise ValueError(f"Cannot convert '{value}' to {self}")
+        except ValueError:  # Re-raise with consistent message
+            raise ValueError(f"Cannot convert '{value}' to {self}") from None
 
     def convertstr(self, value: str) -> Any:
         return self.typ(value)
@@ -140,7 +147,17 @@ class Setting(QObject):
 class BoolSetting(Setting):
     """Stores a boolean setting."""
 
+    __slots__ = ()
+
     typ = bool
+    _TEXT_MAP = {
+        "yes": True,
+        "true": True,
+        "1": True,
+        "no": False,
+        "false": False,
+        "0": False,
+    }
 
     def toggle(self) -> None:
         self.value = not self.value
@@ -149,12 +166,10 @@ class BoolSetting(Setting):
         return ["True", "False"]
 
     def convertstr(self, text: str) -> bool:
-        text = text.lower()
-        if text in ("yes", "true", "1"):
-            return True
-        if text in ("no", "false", "0"):
-            return False
-        raise ValueError
+        try:
+            return self._TEXT_MAP[text.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid option: {text}") from None
 
     def __str__(self) -> str:
         return "Bool"
@@ -174,6 +189,8 @@ class PromptSetting(Setting):
         _question: Actual question the user is prompted with.
     """
 
+    __slots__ = "_title", "_question"
+
     class Options(enum.Enum):
         """Enum of valid options for this setting."""
 
@@ -185,6 +202,13 @@ class PromptSetting(Setting):
             return str(self.value)
 
     typ = Options
+    _TEXT_MAP: Dict[str, Options] = {
+        **{option.value: option for option in Options},
+        "yes": Options.true,
+        "1": Options.true,
+        "no": Options.false,
+        "0": Options.false,
+    }
 
     def __init__(
         self, *args: Any, question_title: str, question_body: str, **kwargs: Any
@@ -196,23 +220,25 @@ class PromptSetting(Setting):
     def suggestions(self) -> List[str]:
         return ["true", "prompt", "false"]
 
+    def convert(self, value: Any) -> "PromptSetting.Options":
+        if isinstance(value, self.Options):  # Skip calling the enum on defaults
+            return value
+        return super().convert(value)
+
     def convertstr(self, text: str) -> "PromptSetting.Options":
-        text = text.lower()
-        if text in ("yes", "1"):
-            return self.Options.true
-        if text in ("no", "0"):
-            return self.Options.false
-        return self.Options(text)
+        try:
+            return self._TEXT_MAP[text.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid option: {text}") from None
 
     def __str__(self) -> str:
         return "Prompt"
 
     def __bool__(self) -> bool:
-        if self.value == self.Options.ask:
+        value = self._value
+        if value is self.Options.ask:
             return bool(prompt.ask_question(title=self._title, body=self._question))
-        if self.value == self.Options.false:
-            return False
-        return True
+        return value is not self.Options.false
 
 
 class NumberSetting(Setting):  # pylint: disable=abstract-method  # Still abstract class
@@ -226,6 +252,8 @@ class NumberSetting(Setting):  # pylint: disable=abstract-method  # Still abstra
         max_value: Maximum value allowed for this setting.
     """
 
+    __slots__ = "min_value", "max_value"
+
     def __init__(
         self,
         name: str,
@@ -243,21 +271,30 @@ class NumberSetting(Setting):  # pylint: disable=abstract-method  # Still abstra
 
     def __iadd__(self, value: customtypes.NumberStr) -> "NumberSetting":
         """Add a value to the currently stored number."""
-        self.value += super().convert(value)
+        self.value = self._value + self._convert_operand(value)
         return self
 
     def __imul__(self, value: customtypes.NumberStr) -> "NumberSetting":
         """Multiply the currently stored number with a value."""
-        self.value *= super().convert(value)
+        self.value = self._value * self._convert_operand(value)
         return self
 
     def convert(self, value: customtypes.NumberStr) -> customtypes.Number:
         return clamp(super().convert(value), self.min_value, self.max_value)
 
+    def _convert_operand(self, value: customtypes.NumberStr) -> customtypes.Number:
+        """Convert an operand to the setting type without clamping it."""
+        try:
+            return self.typ(value)
+        except ValueError:
+            raise ValueError(f"Cannot convert '{value}' to {self}") from None
+
 
 class IntSetting(NumberSetting):
     """Stores an integer setting."""
 
+    __slots__ = ()
+
     typ = int
 
     def __str__(self) -> str:
@@ -267,6 +304,8 @@ class IntSetting(NumberSetting):
 class FloatSetting(NumberSetting):
     """Stores a float setting."""
 
+    __slots__ = ()
+
     typ = float
 
     def __str__(self) -> str:
@@ -280,19 +319,23 @@ class ThumbnailSizeSetting(Setting):
     512.
     """
 
+    __slots__ = ()
+
     typ = int
     ALLOWED_VALUES = 64, 128, 256, 512
+    _INDICES = {value: index for index, value in enumerate(ALLOWED_VALUES)}
+    _MAX_INDEX = len(ALLOWED_VALUES) - 1
 
     def convert(self, value: customtypes.IntStr) -> int:
         ivalue = super().convert(value)
-        if ivalue not in self.ALLOWED_VALUES:
+        if ivalue not in self._INDICES:
             raise ValueError("Thumbnail size must be one of 64, 128, 256, 512")
         return ivalue
 
     def step(self, up: bool = True) -> None:
         """Change thumbnail size by one step up if up else down."""
-        index = self.ALLOWED_VALUES.index(self.value) + (1 if up else -1)
-        index = clamp(index, 0, len(self.ALLOWED_VALUES) - 1)
+        index = self._INDICES[self.value] + (1 if up else -1)
+        index = clamp(index, 0, self._MAX_INDEX)
         self.value = self.ALLOWED_VALUES[index]
 
     def suggestions(self) -> List[str]:
@@ -305,6 +348,8 @@ class ThumbnailSizeSetting(Setting):
 class StrSetting(Setting):
     """Stores a string setting."""
 
+    __slots__ = ()
+
     typ = str
 
     def __str__(self) -> str:
@@ -314,6 +359,8 @@ class StrSetting(Setting):
 class OrderSetting(Setting):
     """Stores an ordering setting."""
 
+    __slots__ = ("order_types",)
+
     typ = str
 
     ORDER_TYPES: Dict[str, Callable[..., Any]] = {
@@ -344,7 +391,8 @@ class OrderSetting(Setting):
     def sort(self, values: Iterable[str]) -> List[str]:
         """Sort values according to the current ordering."""
         ordering = self._get_ordering()
-        return sorted(values, key=ordering, reverse=sort.reverse.value)
+        reverse = sort.reverse._value  # pylint: disable=protected-access
+        return sorted(values, key=ordering, reverse=reverse)
 
     def suggestions(self) -> List[str]:
         return list(self.order_types)
@@ -358,9 +406,10 @@ class OrderSetting(Setting):
         ordering = self.order_types[self.value]
         if self.value not in self.STR_ORDER_TYPES:
             return ordering
-        if sort.ignore_case.value:
-            return lambda s: ordering(s.lower())
-        return lambda s: ordering(s)
+        basename = os.path.basename
+        if sort.ignore_case._value:  # pylint: disable=protected-access
+            return lambda s, _ordering=ordering: _ordering(basename(s).lower())
+        return lambda s, _ordering=ordering: _ordering(basename(s))
 
     def __str__(self) -> str:
         return "Order"
@@ -382,6 +431,11 @@ style = StrSetting("style", "default", hidden=True)
 read_only = BoolSetting(
     "read_only", False, desc="Disable any commands that are able to edit files on disk"
 )
+trust_extensions = BoolSetting(
+    "trust_extensions",
+    True,
+    desc="Accept files with common image extensions without checking their header",
+)
 
 
 class command:  # pylint: disable=invalid-name
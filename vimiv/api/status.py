@@ -30,7 +30,7 @@ If any other object requires the status to be updated, they should call
 
 import functools
 import re
-from typing import Callable, TypeVar, Any, Dict
+from typing import Callable, TypeVar, Any, Dict, Tuple
 
 from vimiv.qt.core import Signal, QObject
 
@@ -44,7 +44,7 @@ ModuleFunc = TypeVar("ModuleFunc", Callable[[], str], Callable[[Any], str])
 
 
 _modules: Dict[str, "_Module"] = {}  # Dictionary storing all status modules
-_module_expression = re.compile(r"\{.*?\}")  # Expression to match all status modules
+_module_expression = re.compile(r"(\{.*?\})")  # Expression to match all status modules
 _logger = log.module_logger(__name__)
 
 
@@ -102,14 +102,32 @@ def evaluate(text: str) -> str:
     Returns:
         The updated text.
     """
-    modules = _module_expression.findall(text)
-    for module_name in modules:
+    parts = list(_split(text))
+    # Every odd part is a module name, see _split
+    for i in range(1, len(parts), 2):
+        module_name = parts[i]
         try:
-            text = text.replace(module_name, _modules[module_name]())
+            parts[i] = _modules[module_name]()
         except KeyError:
-            text = text.replace(module_name, "")
+            parts[i] = ""
             _log_unknown_module(module_name)
-    return text
+    return "".join(parts)
+
+
+@functools.lru_cache(64)
+def _split(text: str) -> Tuple[str, ...]:
+    """Split text into ordinary text and module names.
+
+    The lru_cache is used as the same few texts, e.g. the statusbar settings, are
+    evaluated on every status update.
+
+    Args:
+        text: The text to split.
+    Returns:
+        Tuple alternating between ordinary text and module names, starting and ending
+        with ordinary text.
+    """
+    return tuple(_module_expression.split(text))
 
 
 @functools.lru_cache(None)
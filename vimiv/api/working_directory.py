@@ -109,6 +109,7 @@ class WorkingDirectoryHandler(QFileSystemWatcher):
         settings.sort.directory_order.changed.connect(self._reorder_directory)
         settings.sort.reverse.changed.connect(self._reorder_directory)
         settings.sort.ignore_case.changed.connect(self._reorder_directory)
+        settings.trust_extensions.changed.connect(self._on_trust_extensions_changed)
 
         self.directoryChanged.connect(self._reload_directory)
         self.fileChanged.connect(self._on_file_changed)
@@ -225,7 +226,14 @@ class WorkingDirectoryHandler(QFileSystemWatcher):
         """
         show_hidden = settings.library.show_hidden.value
         paths = files.listdir(directory, show_hidden=show_hidden)
-        return self._order_paths(*files.supported(paths))
+        trust_extensions = settings.trust_extensions.value
+        return self._order_paths(
+            *files.supported(paths, trust_extensions=trust_extensions)
+        )
+
+    def _on_trust_extensions_changed(self, _value: bool) -> None:
+        """Reload the directory as the supported images may have changed."""
+        self._reload_directory(self._dir)
 
     @slot
     def _reorder_directory(self) -> None:
@@ -31,7 +31,12 @@ def delete(paths: List[str], ask: bool = False) -> None:
     ):
         return
     _last_deleted.clear()
-    images = [path for path in paths if files.is_image(path)]
+    trust_extensions = api.settings.trust_extensions.value
+    images = [
+        path
+        for path in paths
+        if files.is_image(path, trust_extensions=trust_extensions)
+    ]
     if not images:
         raise api.commands.CommandError("No images to delete")
     failed_images = []
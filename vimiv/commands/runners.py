@@ -5,10 +5,14 @@
 Module Attributes:
     SEPARATOR: String used to separate chained commands.
 
+    _SHLEX_CHARS: Characters in command text that require parsing with shlex.
+    _RE_SHLEX_WHITESPACE: Regular expression matching the whitespace shlex splits on.
+
     _last_command: Dictionary storing the last command for each mode.
 """
 
 import os
+import re
 import shlex
 from typing import Dict, List, NamedTuple, Tuple
 
@@ -17,6 +21,8 @@ from vimiv.utils import log, customtypes
 from vimiv.commands import aliases, external, wildcards
 
 SEPARATOR = "&&"
+_SHLEX_CHARS = "\"'\\"
+_RE_SHLEX_WHITESPACE = re.compile(r"[ \t\r\n]+")
 external_runner = external.ExternalRunner()
 
 _last_command: Dict[api.modes.Mode, "LastCommand"] = {}
@@ -150,7 +156,7 @@ def _run_command(
         cmd(args, count=count)
         api.status.update("ran command")
     except api.commands.CommandNotFound as e:
-        log.error(str(e))
+        log.error("%s", e)
         raise CommandPartFailed from e
     except (
         api.commands.ArgumentError,
@@ -160,7 +166,7 @@ def _run_command(
         log.error("%s: %s", cmdname, e)
         raise CommandPartFailed from e
     except api.commands.CommandWarning as w:
-        log.warning("%s: %s", cmdname, str(w))
+        log.warning("%s: %s", cmdname, w)
         raise CommandPartFailed from w
     except api.commands.CommandInfo as i:
         log.info("%s: %s", cmdname, i)
@@ -178,15 +184,18 @@ def _parse(text: str) -> Tuple[str, str, List[str]]:
         args: Arguments passed.
     """
     text = text.strip()
-    count = ""
-    split = shlex.split(text)
+    # Only use the comparably slow shlex if the text requires it
+    if any(char in text for char in _SHLEX_CHARS):
+        split = shlex.split(text)
+    else:
+        split = _RE_SHLEX_WHITESPACE.split(text)
     cmdname = split[0]
     # Receive prepended digits as count
-    while cmdname and cmdname[0].isdigit():
-        count += cmdname[0]
-        cmdname = cmdname[1:]
+    digits = 0
+    while digits < len(cmdname) and cmdname[digits].isdigit():
+        digits += 1
     args = split[1:]
-    return count, cmdname, args
+    return cmdname[:digits], cmdname[digits:], args
 
 
 def alias(text: str, mode: api.modes.Mode) -> str:
@@ -2,8 +2,9 @@
 
 """Overlay widget to display image metadata."""
 
+import functools
 import itertools
-from typing import Optional
+from typing import Optional, Tuple
 
 from vimiv.qt.core import Qt
 from vimiv.qt.widgets import QLabel, QSizePolicy, QWidget
@@ -150,10 +151,8 @@ class MetadataWidget(QLabel):
         _logger.debug(
             "%s: reading metadata of %s", self.__class__.__qualname__, self._path
         )
-        keys = [
-            e.strip() for e in api.settings.metadata.current_keyset.value.split(",")
-        ]
-        _logger.debug(f"Extracting metadata for keys: {keys}")
+        keys = _parse_keyset(api.settings.metadata.current_keyset.value)
+        _logger.debug("Extracting metadata for keys: %s", keys)
         try:
             data = self.handler.get_metadata(keys)
             if data:
@@ -175,3 +174,12 @@ class MetadataWidget(QLabel):
         self._handler = None
         if self.isVisible():
             self._update_text()
+
+
+@functools.lru_cache(8)
+def _parse_keyset(keyset: str) -> Tuple[str, ...]:
+    """Split a comma-separated keyset into its stripped keys.
+
+    The lru_cache is used as the same few keysets are parsed for every image.
+    """
+    return tuple(key.strip() for key in keyset.split(","))
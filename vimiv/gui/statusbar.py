@@ -73,7 +73,7 @@ class StatusBar(QWidget):
     @utils.slot
     def _update_status(self):
         """Update the statusbar."""
-        mode = api.modes.current().name.lower()
+        mode = api.modes.current().name
         for position, label in self:
             text = self._get_text(position, mode)
             label.setText(text)
@@ -259,7 +259,9 @@ def _load_single(path: str) -> None:
     """Populate list of paths in same directory for single path."""
     if path in _paths:
         goto(_paths.index(path) + 1)  # goto is indexed from 1
-    elif path not in api.working_directory.handler.images and files.is_image(path):
+    elif path not in api.working_directory.handler.images and files.is_image(
+        path, trust_extensions=api.settings.trust_extensions.value
+    ):
         _load_paths([path, *api.working_directory.handler.images], path)
     else:
         _load_paths(api.working_directory.handler.images, path)
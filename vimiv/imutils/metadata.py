@@ -13,9 +13,12 @@ Module Attributes:
 """
 
 import abc
+import concurrent.futures
 import contextlib
+import functools
 import itertools
-from typing import Dict, Tuple, NoReturn, Sequence, Iterable, Type, List
+import os
+from typing import Dict, Tuple, NoReturn, Sequence, Iterable, Type, List, Optional
 
 from vimiv.utils import log
 
@@ -34,6 +37,8 @@ class MetadataPlugin(abc.ABC):
     The implementation of `copy_metadata` and `get_date_time` is optional.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __init__(self, _path: str) -> None:
         """Initialize metadata handler for a specific image.
@@ -110,10 +115,26 @@ class MetadataHandler:
 
     Attributes:
         _path: Path to current image.
+        _backends: Instances of all registered plugins for the current image or None.
+            Use the backends property for access.
     """
 
+    __slots__ = "_path", "_backends"
+
     def __init__(self, path: str):
         self._path = path
+        self._backends: Optional[List[MetadataPlugin]] = None
+
+    @property
+    def backends(self) -> List[MetadataPlugin]:
+        """Instances of all registered plugins for the current image.
+
+        The instances are created on first access. This ensures the metadata is only
+        read once it is needed and only a single time per handler.
+        """
+        if self._backends is None:
+            self._backends = [backend(self._path) for backend in _registry]
+        return self._backends
 
     @property
     def has_copy_metadata(self) -> bool:
@@ -143,13 +164,10 @@ class MetadataHandler:
         if not has_metadata_support():
             MetadataHandler.raise_exception("get_metadata")
 
-        out: MetadataDictT = {}
-
-        for backend in _registry:
-            # TODO: from 3.9 on use: c = a | b
-            out = {**backend(self._path).get_metadata(keys), **out}
-
-        return out
+        identifier = _file_identifier(self._path)
+        if identifier is None:
+            return self._get_metadata(keys)
+        return dict(_get_metadata_cached(identifier, tuple(_registry), tuple(keys)))
 
     def get_keys(self) -> Iterable[str]:
         """Get the keys for all metadata values available for the current image.
@@ -165,8 +183,8 @@ class MetadataHandler:
 
         out: Iterable[str] = iter([])
 
-        for backend in _registry:
-            out = itertools.chain(out, backend(self._path).get_keys())
+        for backend in self.backends:
+            out = itertools.chain(out, backend.get_keys())
 
         return out
 
@@ -187,11 +205,10 @@ class MetadataHandler:
 
         failed = []
 
-        for backend in _registry:
+        for backend in self.backends:
             with contextlib.suppress(NotImplementedError):
-                be = backend(self._path)
-                if not be.copy_metadata(dest, reset_orientation):
-                    failed.append(be.name())
+                if not backend.copy_metadata(dest, reset_orientation):
+                    failed.append(backend.name())
 
         if failed:
             _logger.warning(
@@ -211,9 +228,26 @@ class MetadataHandler:
         if not has_metadata_support() or not self.has_get_date_time:
             MetadataHandler.raise_exception("get_date_time")
 
-        for backend in _registry:
+        identifier = _file_identifier(self._path)
+        if identifier is None:
+            return self._get_date_time()
+        return _get_date_time_cached(identifier, tuple(_registry))
+
+    def _get_metadata(self, keys: Sequence[str]) -> MetadataDictT:
+        """Combine the metadata of all backends, see get_metadata."""
+        out: MetadataDictT = {}
+
+        for backend in self.backends:
+            # TODO: from 3.9 on use: c = a | b
+            out = {**backend.get_metadata(keys), **out}
+
+        return out
+
+    def _get_date_time(self) -> str:
+        """Retrieve date and time from the first backend supporting it."""
+        for backend in self.backends:
             with contextlib.suppress(NotImplementedError):
-                out = backend(self._path).get_date_time()
+                out = backend.get_date_time()
                 # If we get an empty string, continue. We may get something better.
                 if out:
                     return out
@@ -231,6 +265,40 @@ class MetadataError(RuntimeError):
     """Raised if for a function there is insufficient metadata support."""
 
 
+def _file_identifier(path: str) -> Optional[Tuple[str, int, int]]:
+    """Return a tuple identifying the current version of a file or None on error.
+
+    The tuple consists of the path, modification time in ns and size of the file.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+# The plugins are part of the arguments so registering a new plugin invalidates the
+# cache, the file identifier so changes to the file on disk do.
+@functools.lru_cache(4096)
+def _get_metadata_cached(
+    identifier: Tuple[str, int, int],
+    _plugins: Tuple[Type[MetadataPlugin], ...],
+    keys: Tuple[str, ...],
+) -> MetadataDictT:
+    """Cached version of MetadataHandler.get_metadata."""
+    handler = MetadataHandler(identifier[0])
+    return handler._get_metadata(keys)  # pylint: disable=protected-access
+
+
+@functools.lru_cache(4096)
+def _get_date_time_cached(
+    identifier: Tuple[str, int, int], _plugins: Tuple[Type[MetadataPlugin], ...]
+) -> str:
+    """Cached version of MetadataHandler.get_date_time."""
+    handler = MetadataHandler(identifier[0])
+    return handler._get_date_time()  # pylint: disable=protected-access
+
+
 def register(plugin: Type[MetadataPlugin]) -> None:
     """Register metadata plugin implementation.
 
@@ -241,10 +309,11 @@ def register(plugin: Type[MetadataPlugin]) -> None:
         plugin: Implementation of `MetadataPlugin`.
     """
 
-    _logger.debug(f"Registring metadata plugin implementation {plugin.name()}")
+    _logger.debug("Registring metadata plugin implementation %s", plugin.name())
     if plugin in _registry:
         _logger.warning(
-            f"Metadata plugin {plugin.name()} has already been registered. Ignoring it."
+            "Metadata plugin %s has already been registered. Ignoring it.",
+            plugin.name(),
         )
         return
 
@@ -260,6 +329,32 @@ def get_registrations() -> List[Tuple[str, str]]:
     return [(e.name(), e.version()) for e in _registry]
 
 
+def read_many(
+    paths: Iterable[str], keys: Sequence[str], workers: Optional[int] = None
+) -> Dict[str, MetadataDictT]:
+    """Get metadata of many images in parallel.
+
+    Args:
+        paths: Paths to the images to query.
+        keys: Keys of metadata to query the images for.
+        workers: Maximum number of threads used. Defaults to the number of CPUs.
+
+    Returns:
+        Dictionary mapping each path to the metadata retrieved for it.
+    """
+    if not has_metadata_support():
+        MetadataHandler.raise_exception("read_many")
+
+    def read(path: str) -> MetadataDictT:
+        return MetadataHandler(path).get_metadata(keys)
+
+    paths = list(paths)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers or os.cpu_count(), thread_name_prefix="metadata"
+    ) as executor:
+        return dict(zip(paths, executor.map(read, paths)))
+
+
 class ExifOrientation:
     """Namespace for exif orientation tags.
 
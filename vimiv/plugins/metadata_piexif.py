@@ -10,7 +10,8 @@ Properties:
 """
 
 import contextlib
-from typing import Any, Sequence, Iterable
+import functools
+from typing import Any, Callable, Dict, List, Sequence, Iterable, Tuple
 
 from vimiv.imutils import metadata
 from vimiv.utils import log, lazy
@@ -19,6 +20,11 @@ piexif = lazy.import_module("piexif", optional=True)
 
 _logger = log.module_logger(__name__)
 
+# IFDs containing tags in the order they are returned by piexif.load
+_IFDS = "0th", "Exif", "GPS", "Interop", "1st"
+
+FormatterT = Callable[[Any], str]
+
 
 class MetadataPiexif(metadata.MetadataPlugin):
     """Provided metadata support based on piexif.
@@ -26,6 +32,8 @@ class MetadataPiexif(metadata.MetadataPlugin):
     Implements `get_metadata`, `get_keys`, `copy_metadata`, and `get_date_time`.
     """
 
+    __slots__ = "_path", "_metadata"
+
     def __init__(self, path: str) -> None:
         self._path = path
 
@@ -66,41 +74,16 @@ class MetadataPiexif(metadata.MetadataPlugin):
         if self._metadata is None:
             return {}
 
-        try:
-            for ifd in self._metadata:
-                if ifd == "thumbnail":
-                    continue
-
-                for tag in self._metadata[ifd]:
-                    keyname = piexif.TAGS[ifd][tag]["name"]
-                    keytype = piexif.TAGS[ifd][tag]["type"]
+        tags_by_name = _tags_by_name()
+        for keyname, key in desired_keys_map.items():
+            # Tags in later IFDs take precedence, as when iterating over all tags
+            for ifd, tag, formatter in reversed(tags_by_name.get(keyname, [])):
+                try:
                     val = self._metadata[ifd][tag]
-                    if keyname not in desired_keys_map:
-                        continue
-                    if keytype in (
-                        piexif.TYPES.Byte,
-                        piexif.TYPES.Short,
-                        piexif.TYPES.Long,
-                        piexif.TYPES.SByte,
-                        piexif.TYPES.SShort,
-                        piexif.TYPES.SLong,
-                        piexif.TYPES.Float,
-                        piexif.TYPES.DFloat,
-                    ):  # integer and float
-                        out[desired_keys_map[keyname]] = (keyname, str(val))
-                    elif keytype in (
-                        piexif.TYPES.Ascii,
-                        piexif.TYPES.Undefined,
-                    ):  # byte encoded
-                        out[desired_keys_map[keyname]] = (keyname, val.decode())
-                    elif keytype in (
-                        piexif.TYPES.Rational,
-                        piexif.TYPES.SRational,
-                    ):  # (int, int) <=> numerator, denominator
-                        out[desired_keys_map[keyname]] = (keyname, f"{val[0]}/{val[1]}")
-
-        except KeyError:
-            return {}
+                except KeyError:
+                    continue
+                out[key] = (keyname, formatter(val))
+                break
 
         return out
 
@@ -143,6 +126,52 @@ class MetadataPiexif(metadata.MetadataPlugin):
         return ""
 
 
+@functools.lru_cache(None)
+def _tags_by_name() -> Dict[str, List[Tuple[str, int, FormatterT]]]:
+    """Map each piexif tag name to the IFDs it can occur in.
+
+    The lru_cache is used so the mapping is only created once, when it is first needed,
+    as piexif is imported lazily.
+
+    Returns:
+        Dictionary mapping the tag name to a list of (ifd, tag, formatter) tuples
+        ordered like the IFDs returned by piexif.load. Tags of types which cannot be
+        formatted are not included.
+    """
+    formatters: Dict[int, FormatterT] = {
+        # integer and float
+        piexif.TYPES.Byte: str,
+        piexif.TYPES.Short: str,
+        piexif.TYPES.Long: str,
+        piexif.TYPES.SByte: str,
+        piexif.TYPES.SShort: str,
+        piexif.TYPES.SLong: str,
+        piexif.TYPES.Float: str,
+        piexif.TYPES.DFloat: str,
+        # byte encoded
+        piexif.TYPES.Ascii: _format_bytes,
+        piexif.TYPES.Undefined: _format_bytes,
+        # (int, int) <=> numerator, denominator
+        piexif.TYPES.Rational: _format_rational,
+        piexif.TYPES.SRational: _format_rational,
+    }
+    tags: Dict[str, List[Tuple[str, int, FormatterT]]] = {}
+    for ifd in _IFDS:
+        for tag, info in piexif.TAGS[ifd].items():
+            formatter = formatters.get(info["type"])
+            if formatter is not None:
+                tags.setdefault(info["name"], []).append((ifd, tag, formatter))
+    return tags
+
+
+def _format_bytes(value: bytes) -> str:
+    return value.decode()
+
+
+def _format_rational(value: Tuple[int, int]) -> str:
+    return f"{value[0]}/{value[1]}"
+
+
 def init(*_args: Any, **_kwargs: Any) -> None:
     """Initialize piexif handler if piexif is available."""
     if piexif is not None:
@@ -23,6 +23,8 @@ _logger = log.module_logger(__name__)
 class MetadataPyexiv2(metadata.MetadataPlugin):
     """Provides metadata support based on pyexiv2."""
 
+    __slots__ = "_path", "_metadata"
+
     def __init__(self, path: str) -> None:
         self._path = path
 
@@ -15,6 +15,7 @@ from vimiv.utils.customtypes import AnyT, FuncT, FuncNoneT, NumberT
 
 RE_STR_NOT_ESCAPED = r"(?<!\\)"
 RE_STR_ESCAPED = r"\\"
+_RE_NATURAL_SORT_SPLIT = re.compile(r"(\d+)")
 
 
 def add_html(text: str, *tags: str) -> str:
@@ -521,8 +522,4 @@ def natural_sort(text: str) -> typing.List[typing.Union[str, int]]:
 
     Credits to https://stackoverflow.com/a/5967539/5464989
     """
-
-    def convert(t: str) -> typing.Union[str, int]:
-        return int(t) if t.isdigit() else t
-
-    return [convert(c) for c in re.split(r"(\d+)", text)]
+    return [int(c) if c.isdigit() else c for c in _RE_NATURAL_SORT_SPLIT.split(text)]
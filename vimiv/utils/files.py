@@ -2,48 +2,93 @@
 
 """Functions dealing with files and paths."""
 
+import concurrent.futures
+import itertools
 import os
-from typing import List, Tuple, Iterable
+import stat
+from typing import List, Optional, Tuple, Iterable
 
 from vimiv.utils import imageheader
 
 
+# Checking paths is I/O bound, for many paths the checks are run in parallel
+_PARALLEL_MIN_PATHS = 32
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(8, 2 * (os.cpu_count() or 1)), thread_name_prefix="files"
+)
+_DIRECTORY = "directory"
+_IMAGE = "image"
+_SIZE_UNITS = "B", "K", "M", "G", "T", "P", "E", "Z"
+# Extensions of formats which are always supported by Qt
+_IMAGE_EXTENSIONS = frozenset((".bmp", ".gif", ".jpeg", ".jpg", ".png"))
+
+
 def listdir(directory: str, show_hidden: bool = False) -> List[str]:
-    """Wrapper around os.listdir.
+    """Wrapper around os.scandir.
 
     Args:
-        directory: Directory to check for files in via os.listdir(directory).
+        directory: Directory to check for files in via os.scandir(directory).
         show_hidden: Include hidden files in output.
     Returns:
         List of files in the directory with their absolute path.
     """
     directory = os.path.abspath(os.path.expanduser(directory))
-    return [
-        os.path.join(directory, path)
-        for path in os.listdir(directory)
-        if show_hidden or not path.startswith(".")
-    ]
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if show_hidden or not entry.name.startswith(".")
+        ]
 
 
-def supported(paths: Iterable[str]) -> Tuple[List[str], List[str]]:
+def supported(
+    paths: Iterable[str], trust_extensions: bool = False
+) -> Tuple[List[str], List[str]]:
     """Get a list of supported images and a list of directories from paths.
 
     Args:
         paths: List containing paths to parse.
+        trust_extensions: Accept files with common image extensions without checking
+            their header.
     Returns:
         images: List of images inside the directory.
         directories: List of directories inside the directory.
     """
+    paths = list(paths)
+    if len(paths) > _PARALLEL_MIN_PATHS:
+        kinds = list(_executor.map(_kind, paths, itertools.repeat(trust_extensions)))
+    else:
+        kinds = [_kind(path, trust_extensions) for path in paths]
     directories = []
     images = []
-    for path in paths:
-        if os.path.isdir(path):
+    for path, kind in zip(paths, kinds):
+        if kind is _DIRECTORY:
             directories.append(path)
-        elif is_image(path):
+        elif kind is _IMAGE:
             images.append(path)
     return images, directories
 
 
+def _kind(path: str, trust_extensions: bool) -> Optional[str]:
+    """Return _DIRECTORY or _IMAGE depending on path, None if it is neither."""
+    stat_result = _stat(path)
+    if stat_result is None:
+        return None
+    if stat.S_ISDIR(stat_result.st_mode):
+        return _DIRECTORY
+    if is_image(path, stat_result, trust_extensions):
+        return _IMAGE
+    return None
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    """Return the result of os.stat for path or None if it cannot be retrieved."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
 def get_size(path: str) -> str:
     """Get the size of a path in human readable format.
 
@@ -54,12 +99,11 @@ def get_size(path: str) -> str:
     Returns:
         Size of path as string.
     """
-    try:
-        isfile = os.path.isfile(path)
-    except OSError:
+    stat_result = _stat(path)
+    if stat_result is None:
         return "N/A"
-    if isfile:
-        return get_size_file(path)
+    if stat.S_ISREG(stat_result.st_mode):
+        return sizeof_fmt(stat_result.st_size)
     return get_size_directory(path)
 
 
@@ -80,13 +124,15 @@ def sizeof_fmt(num: float) -> str:
     Returns:
         Filesize in human-readable format.
     """
-    for unit in ("B", "K", "M", "G", "T", "P", "E", "Z"):
-        if num < 1024.0:
-            if num < 100:
-                return f"{num:3.1f}{unit}"
-            return f"{num:3.0f}{unit}"
-        num /= 1024.0
-    return f"{num:.1f}Y"
+    # Each unit covers 10 bits of the number, i.e. a factor of 1024
+    index = (int(num).bit_length() - 1) // 10 if num >= 1 else 0
+    if index >= len(_SIZE_UNITS):
+        return f"{num / (1 << 10 * len(_SIZE_UNITS)):.1f}Y"
+    num /= 1 << 10 * index
+    unit = _SIZE_UNITS[index]
+    if num < 100:
+        return f"{num:3.1f}{unit}"
+    return f"{num:3.0f}{unit}"
 
 
 def get_size_directory(path: str) -> str:
@@ -98,19 +144,33 @@ def get_size_directory(path: str) -> str:
         Size as formatted string.
     """
     try:
-        return str(len(os.listdir(path)))
+        with os.scandir(path) as entries:
+            return str(sum(1 for _ in entries))
     except OSError:
         return "N/A"
 
 
-def is_image(filename: str) -> bool:
+def is_image(
+    filename: str,
+    stat_result: Optional[os.stat_result] = None,
+    trust_extensions: bool = False,
+) -> bool:
     """Check whether a file is an image.
 
     Args:
         filename: Name of file to check.
+        stat_result: Result of os.stat for filename if it is already known.
+        trust_extensions: Accept files with common image extensions without checking
+            their header.
     """
+    if stat_result is None:
+        stat_result = _stat(filename)
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        return False
+    if trust_extensions and os.path.splitext(filename)[1].lower() in _IMAGE_EXTENSIONS:
+        return True
     try:
-        return os.path.isfile(filename) and imageheader.detect(filename) is not None
+        return imageheader.detect(filename) is not None
     except OSError:
         return False
 
@@ -122,10 +182,10 @@ def listfiles(directory: str, abspath: bool = False) -> List[str]:
         directory: The directory to traverse.
         abspath: Return the absolute path to the files, not relative to directory.
     """
-    return [
-        os.path.join(root, fname)
-        if abspath
-        else os.path.join(root.replace(directory, "").lstrip("/"), fname)
-        for root, _, files in os.walk(directory)
-        for fname in files
-    ]
+    paths: List[str] = []
+    # Length of the directory including the separator to strip for relative paths
+    prefix_length = len(directory.rstrip(os.sep)) + 1
+    for root, _, files in os.walk(directory):
+        base = root if abspath else root[prefix_length:]
+        paths.extend(os.path.join(base, fname) for fname in files)
+    return paths
@@ -52,6 +52,7 @@ https://en.wikipedia.org/wiki/List_of_file_signatures
 """
 
 import functools
+import threading
 
 from typing import Optional, List, Callable, Tuple, BinaryIO
 
@@ -64,6 +65,8 @@ _logger = log.module_logger(__name__)
 CheckFuncT = Callable[[bytes, BinaryIO], bool]
 # List containing all registered check functions
 _registry: List[Tuple[str, CheckFuncT]] = []
+# Lock for removing checks from the registry, as detect may be run in multiple threads
+_registry_lock = threading.Lock()
 
 
 def detect(filename: str) -> Optional[str]:
@@ -82,11 +85,12 @@ def detect(filename: str) -> Optional[str]:
     with open(filename, "rb") as f:
         header = f.read(32)
 
-        for filetype, check in _registry:
+        # Iterate over a copy, as checks may be removed by another thread
+        for filetype, check in tuple(_registry):
             # Use try instead of contextlib.suppress due to zero-overhead.
             try:
                 if check(header, f):
-                    _logger.debug(f"Detected {filename} as {filetype}")
+                    _logger.debug("Detected %s as %s", filename, filetype)
                     return filetype
             except IndexError:
                 pass
@@ -120,11 +124,14 @@ def register(
             ):
                 setattr(check_verified, "checked", True)
                 return True
-            _logger.warning(
-                f"Check for {filetype} was register, but display is not supported."
-                "Probably you need to install the required backend module."
-            )
-            _registry.remove((filetype, check_verified))
+            with _registry_lock:
+                if (filetype, check_verified) in _registry:
+                    _logger.warning(
+                        f"Check for {filetype} was register, but display is not "
+                        "supported. Probably you need to install the required backend "
+                        "module."
+                    )
+                    _registry.remove((filetype, check_verified))
         return False
 
     check_register = check_verified if validate else check
@@ -169,6 +169,10 @@ class LazyLogger:
             self._stored_messages.add(msg)
         self._logger.log(level, msg, *args, **kwargs)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Return True if messages of this level are logged, like logging.Logger."""
+        return level >= self.level
+
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         self.log(logging.DEBUG, msg, *args, **kwargs)
 